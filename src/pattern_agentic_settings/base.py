@@ -1,14 +1,24 @@
-from typing import Optional
+from typing import ClassVar, Optional
 
-from pydantic import ValidationError, Field
-from pydantic_settings import BaseSettings
+from pydantic import ValidationError, Field, PrivateAttr
+from pydantic_settings import BaseSettings, DotEnvSettingsSource, EnvSettingsSource
 
 import os
+import re
 import sys
 import logging
-import importlib
+import functools
 
 
+_SEP_RE = re.compile(r'[-_]')
+
+SENSITIVE_KEYS = (
+    'password', 'secret', 'key', 'token', 'auth', 'service_account'
+)
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_KEYS)))
+
+
+@functools.lru_cache(maxsize=None)
 def _create_default_logger():
     lg = logging.getLogger(__name__)
     lg.setLevel(logging.INFO)
@@ -20,11 +30,150 @@ def _create_default_logger():
     return lg
 
 
-class PABaseSettings(BaseSettings):
+def _version_from_module(package_name: str) -> Optional[str]:
+    # a package that is already imported can expose a build-time
+    # __version__ (e.g. generated by setuptools-scm or hatch-vcs)
+    module = sys.modules.get(package_name.replace("-", "_"))
+    return getattr(module, '__version__', None)
+
+
+@functools.lru_cache(maxsize=None)
+def _prettify(package_name: str) -> str:
+    return " ".join(word.capitalize() for word in _SEP_RE.split(package_name))
+
+
+def _env_file_mtimes(*paths: Optional[str]) -> dict:
+    """Map each existing env file to its (mtime, size) signature."""
+    mtimes = {}
+    for path in paths:
+        if not path:
+            continue
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        mtimes[path] = (st.st_mtime_ns, st.st_size)
+    return mtimes
+
+
+def _dot_env_values(settings_cls, path: Optional[str]) -> Optional[dict]:
+    """Return the raw, unvalidated field values set in the .env file."""
+    if not path:
+        return None
+    return DotEnvSettingsSource(settings_cls, env_file=path)()
+
+
+def _has_default_sources(settings_cls) -> bool:
+    return (settings_cls.settings_customise_sources.__func__
+            is BaseSettings.settings_customise_sources.__func__)
+
+
+def _redact(key: str, value, sensitive: frozenset):
+    if key not in sensitive:
+        return value
+    return '(empty)' if value is None or value == '' else '(redacted)'
+
+
+def _version_from_dist_info(package_name: str) -> Optional[str]:
+    """Read the version from the dist-info METADATA next to the package.
+
+    Much cheaper than importlib.metadata, but only finds regular installs
+    where the package and its dist-info share a directory.
+    """
+    from importlib.util import find_spec
+    try:
+        spec = find_spec(package_name.replace("-", "_"))
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin:
+        return None
+
+    location = os.path.dirname(spec.origin)
+    if spec.submodule_search_locations is not None:
+        location = os.path.dirname(location)
+
+    dist_name = package_name.replace("-", "_").replace(".", "_").lower()
+    try:
+        entries = os.listdir(location)
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.endswith(".dist-info"):
+            continue
+        if entry.split("-", 1)[0].replace(".", "_").lower() != dist_name:
+            continue
+        try:
+            with open(os.path.join(location, entry, "METADATA"), encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("Version:"):
+                        return line[len("Version:"):].strip()
+                    if not line.strip():
+                        # end of the metadata headers
+                        break
+        except OSError:
+            continue
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _version_from_importlib(package_name: str, fallback: Optional[str]):
+    dist_version = _version_from_dist_info(package_name)
+    if dist_version:
+        return dist_version
+
+    # imported lazily: importlib.metadata is slow to import and is not
+    # needed when the caller passes an explicit app_version
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return fallback or "0.0.0-dev"
+
+
+class _PABaseSettingsHooks(BaseSettings):
+    """Computes the per-class lookups below once, when a class is created.
+
+    Pydantic only calls __pydantic_init_subclass__ for subclasses of the
+    class defining it, so it lives here to also run for PABaseSettings.
+    """
+    _DOT_ENV_VAR: ClassVar[str] = "DOT_ENV"
+    _FIELD_NAMES: ClassVar[tuple[str, ...]] = ()
+    _DESCRIBE_KEYS: ClassVar[tuple[str, ...]] = ()
+    _SENSITIVE_FIELDS: ClassVar[frozenset] = frozenset()
+    _PARTIAL_RELOAD: ClassVar[bool] = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs):
+        super().__pydantic_init_subclass__(**kwargs)
+        env_prefix = cls.model_config.get('env_prefix', '')
+        cls._DOT_ENV_VAR = f"{env_prefix}DOT_ENV"
+        cls._FIELD_NAMES = tuple(cls.model_fields)
+        cls._DESCRIBE_KEYS = tuple(sorted(
+            [k for k, f in cls.model_fields.items() if not f.exclude]
+            + list(cls.model_computed_fields)
+        ))
+        cls._SENSITIVE_FIELDS = frozenset(
+            k for k in cls._DESCRIBE_KEYS if _SENSITIVE_RE.search(k) is not None
+        )
+        # validating changed .env values one by one is only equivalent to
+        # a full rebuild when no model validator sees the half-updated
+        # model and no nested values need merging across sources
+        cls._PARTIAL_RELOAD = (
+            _has_default_sources(cls)
+            and not cls.__pydantic_decorators__.model_validators
+            and not cls.model_config.get('env_nested_delimiter')
+        )
+
+
+class PABaseSettings(_PABaseSettingsHooks):
     dot_env: Optional[str] = Field(default=None, description="The path to the .env file to load env variables from (optional)")
     app_name: str
     app_version: str
 
+    _logger: logging.Logger = PrivateAttr()
+    _env_mtimes: dict = PrivateAttr(default_factory=dict)
+    _dot_env_values: Optional[dict] = PrivateAttr(default=None)
+
     @staticmethod
     def format_config_validation_error(error: ValidationError) -> str:
         """Format Pydantic validation errors into a more readable format."""
@@ -32,62 +181,100 @@ class PABaseSettings(BaseSettings):
         invalid_fields = []
 
         for err in error.errors():
+            loc = err.get('loc')
+            field_name = loc[0] if loc else 'unknown'
             if err['type'] == 'missing':
-                missing_fields.append(err['loc'][0] if err['loc'] else 'unknown')
+                missing_fields.append(field_name)
             else:
-                field_name = err['loc'][0] if err['loc'] else 'unknown'
                 invalid_fields.append(f"{field_name}: {err['msg']}")
 
-        error_message = "Configuration validation failed:\n"
+        parts = ["Configuration validation failed:\n"]
 
         if missing_fields:
-            error_message += "\nMissing required configuration fields:\n"
-            for field in sorted(missing_fields):
-                error_message += f"  - {field}\n"
+            parts.append("Missing required configuration fields:")
+            parts.extend(f"  - {field}" for field in sorted(missing_fields))
+            parts.append("")
 
         if invalid_fields:
-            error_message += "\nInvalid configuration values:\n"
-            for field in invalid_fields:
-                error_message += f"  - {field}\n"
+            parts.append("Invalid configuration values:")
+            parts.extend(f"  - {field}" for field in invalid_fields)
+            parts.append("")
 
-        error_message += "\nPlease check your environment variables or .env file."
-        return error_message
+        parts.append("Please check your environment variables or .env file.")
+        return "\n".join(parts)
 
     def reload(self):
-        """Reload env files and update this instance in-place."""
-        new_instance = self.__class__(
-            app_version=self.app_version,
-            _env_file=self.dot_env
-        )
-        new_values = new_instance.model_dump()
-        for k, v in new_values.items():
-            old = getattr(self, k)
-            if v != old:
+        """Reload env files and update this instance in-place.
+
+        Does nothing if the .env file has not been modified since it was
+        last loaded. Otherwise only the values that changed in the .env
+        file since the previous reload are re-validated. The whole model is
+        rebuilt on the first reload, when values were removed from the file
+        or it sets keys other than field names, and for classes where
+        per-value validation would differ from a rebuild (see
+        _PARTIAL_RELOAD).
+        """
+        env_mtimes = _env_file_mtimes(self.dot_env)
+        if self.dot_env and env_mtimes == self._env_mtimes:
+            self._logger.info("No changes")
+            return
+
+        cls = self.__class__
+        # read before any rebuild below parses the file again, so the
+        # snapshot is never newer than the values actually applied
+        dot_env_values = _dot_env_values(cls, self.dot_env)
+        if cls._PARTIAL_RELOAD and dot_env_values is not None:
+            # init kwargs and env vars take precedence over the .env file;
+            # leaving them out of the snapshot makes their .env value count
+            # as changed once the override goes away
+            overridden = EnvSettingsSource(cls)().keys() | {'app_name', 'app_version'}
+            dot_env_values = {
+                k: v for k, v in dot_env_values.items() if k not in overridden
+            }
+        previous = self._dot_env_values
+        if (cls._PARTIAL_RELOAD
+                and previous is not None and dot_env_values is not None
+                and previous.keys() <= dot_env_values.keys() <= cls.model_fields.keys()):
+            changed = [
+                k for k, v in dot_env_values.items() if previous.get(k) != v
+            ]
+            new_instance = self.model_copy()
+            for k in changed:
+                cls.__pydantic_validator__.validate_assignment(
+                    new_instance, k, dot_env_values[k]
+                )
+        else:
+            new_instance = cls(
+                app_name=self.app_name,
+                app_version=self.app_version,
+                _env_file=self.dot_env
+            )
+            changed = cls._FIELD_NAMES
+
+        for k in changed:
+            new = getattr(new_instance, k)
+            if new != getattr(self, k):
                 self._logger.info(f"Reloading changed parameter {k}")
-                setattr(self, k, v)
+                setattr(self, k, new)
+        self._env_mtimes = env_mtimes
+        self._dot_env_values = dot_env_values
         self._logger.info("-------------------")
 
-
     def safe_describe(self, indent="  "):
-        sensitive_keys = [
-            'password', 'secret', 'key', 'token', 'auth', 'service_account'
-        ]
-        safe_desc = {}
-        for key, value in self.model_dump().items():
-            if any(x in key for x in sensitive_keys):
-                none_or_empty = (value is None or value == '')
-                safe_desc[key] = '(empty)' if none_or_empty else '(redacted)'
-            else:
-                safe_desc[key] = value
-        keys = sorted(safe_desc.keys())
-        return "\n".join([f"{indent}{k}: {safe_desc[k]}" for k in keys])
-
-    @staticmethod
-    def _version_from_importlib(package_name: str, fallback: Optional[str]):
-        try:
-            return importlib.metadata.version(package_name)
-        except importlib.metadata.PackageNotFoundError:
-            return fallback or "0.0.0-dev"
+        # model_dump() applies excluded fields and custom serializers,
+        # which may hide values that must not reach the logs
+        values = self.model_dump()
+        keys = self._DESCRIBE_KEYS
+        sensitive = self._SENSITIVE_FIELDS
+        if values.keys() != set(keys):
+            # extra values, a model serializer or a conditional exclude
+            keys = sorted(values)
+            sensitive = frozenset(
+                k for k in keys if _SENSITIVE_RE.search(k) is not None
+            )
+        return "\n".join(
+            f"{indent}{k}: {_redact(k, values[k], sensitive)}" for k in keys
+        )
 
     @classmethod
     def load(cls,
@@ -101,24 +288,29 @@ class PABaseSettings(BaseSettings):
         if logger is None:
             logger = _create_default_logger()
 
-        env_prefix = cls.model_config.get('env_prefix', '')
-        dot_env_path = os.environ.get(f"{env_prefix}DOT_ENV", None)
+        dot_env_path = os.environ.get(cls._DOT_ENV_VAR, None)
         if dot_env_path and not os.path.isfile(dot_env_path):
             logger.warning(f"WARNING: dot env file '{dot_env_path}' does not exist\n")
 
-        version = app_version
-        if not version:
-            version = PABaseSettings._version_from_importlib(package_name, fallback_version)
+        app_ver = app_version
+        if not app_ver:
+            app_ver = _version_from_module(package_name)
+        if not app_ver:
+            app_ver = _version_from_importlib(package_name, fallback_version)
 
         pretty_app_name = app_name
         if not pretty_app_name:
-            components = package_name.replace("-", "_").split("_")
-            pretty_app_name = " ".join(word.capitalize() for word in components)
+            pretty_app_name = _prettify(package_name)
+
+        # stat before parsing, so a write landing in between is picked up
+        # by the next reload() rather than recorded as already applied
+        env_mtimes = _env_file_mtimes(dot_env_path)
 
         try:
-            settings = cls(app_version=version, app_name=pretty_app_name, _env_file=dot_env_path)
+            settings = cls(app_version=app_ver, app_name=pretty_app_name, _env_file=dot_env_path)
             settings._logger = logger
-            logger.info(f"{pretty_app_name} v{version}")
+            settings._env_mtimes = env_mtimes
+            logger.info(f"{pretty_app_name} v{app_ver}")
             if log_conf_on_startup:
                 logger.info(f"\nConfiguration:\n{settings.safe_describe()}\n--------------------\n")
             return settings
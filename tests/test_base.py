@@ -1,5 +1,9 @@
 import os
+import logging
+import sys
+import types
 import pytest
+from pydantic import BaseModel, Field, computed_field, field_serializer, field_validator, model_validator
 from pydantic_settings import SettingsConfigDict
 from pattern_agentic_settings.base import PABaseSettings
 
@@ -27,3 +31,225 @@ def test_settings_load_with_missing_attr(monkeypatch):
             'pattern_agentic_settings',
         )
 
+def test_settings_load_version_from_module(monkeypatch):
+    monkeypatch.setenv('TST_WORKER_COUNT', '42')
+    module = types.ModuleType('my_versioned_app')
+    module.__version__ = '9.8.7'
+    monkeypatch.setitem(sys.modules, 'my_versioned_app', module)
+    settings = Settings.load('my-versioned-app')
+
+    assert settings.app_version == '9.8.7'
+    assert settings.app_name == 'My Versioned App'
+
+def test_safe_describe_redacts_sensitive_fields(monkeypatch):
+    class SecretSettings(Settings):
+        api_token: str
+        db_password: str = ''
+
+    monkeypatch.setenv('TST_WORKER_COUNT', '42')
+    monkeypatch.setenv('TST_API_TOKEN', 'hunter2')
+    settings = SecretSettings.load('pattern_agentic_settings')
+    desc = settings.safe_describe()
+
+    assert 'hunter2' not in desc
+    assert '  api_token: (redacted)' in desc
+    assert '  db_password: (empty)' in desc
+    assert '  worker_count: 42' in desc
+
+def test_safe_describe_includes_computed_and_extra_fields(monkeypatch, tmp_path):
+    class ExtraSettings(Settings):
+        model_config = SettingsConfigDict(env_prefix="TST_", extra='allow')
+
+        @computed_field
+        @property
+        def api_key_hint(self) -> str:
+            return 'abc...'
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_WORKER_COUNT=3\nEXTRA_THING=1\nEXTRA_TOKEN=hunter2\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    settings = ExtraSettings.load('pattern_agentic_settings')
+    desc = settings.safe_describe()
+
+    assert '  api_key_hint: (redacted)' in desc
+    assert '  extra_thing: 1' in desc
+    assert '  extra_token: (redacted)' in desc
+    assert desc.splitlines() == sorted(desc.splitlines())
+
+
+def test_safe_describe_respects_exclude_and_serializers(monkeypatch):
+    class MaskedSettings(Settings):
+        dsn: str = Field(default="postgres://u:hunter2@db/x", exclude=True)
+        url: str = "https://u:pw@host"
+
+        @field_serializer('url')
+        def mask_url(self, value):
+            return value.rsplit('@', 1)[-1]
+
+    monkeypatch.setenv('TST_WORKER_COUNT', '42')
+    settings = MaskedSettings.load('pattern_agentic_settings')
+    desc = settings.safe_describe()
+
+    assert 'dsn' not in desc
+    assert 'hunter2' not in desc
+    assert 'pw@' not in desc
+    assert '  url: host' in desc
+
+
+def test_settings_reload(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_WORKER_COUNT=5\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    settings = Settings.load('pattern_agentic_settings')
+    assert settings.worker_count == 5
+
+    env_file.write_text("TST_WORKER_COUNT=15\n")
+    settings.reload()
+
+    assert settings.worker_count == 15
+    assert settings.app_name == 'Pattern Agentic Settings'
+
+def test_settings_reload_skips_unchanged_env_file(monkeypatch, tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_WORKER_COUNT=5\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    settings = Settings.load('pattern_agentic_settings')
+
+    # the .env file is unchanged, so reload() is a no-op
+    monkeypatch.setenv('TST_WORKER_COUNT', '7')
+    settings.reload()
+
+    assert settings.worker_count == 5
+
+def test_settings_load_version_from_dist_info(monkeypatch, tmp_path):
+    (tmp_path / "my_installed_app").mkdir()
+    (tmp_path / "my_installed_app" / "__init__.py").write_text("")
+    dist_info = tmp_path / "my_installed_app-2.3.4.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: my-installed-app\nVersion: 2.3.4\n\nDescription\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setenv('TST_WORKER_COUNT', '42')
+    settings = Settings.load('my-installed-app')
+
+    assert settings.app_version == '2.3.4'
+
+def test_settings_reload_validates_only_changed_values(monkeypatch, tmp_path):
+    validated = []
+
+    class CountingSettings(Settings):
+        queue_name: str = 'default'
+
+        @field_validator('worker_count', 'queue_name')
+        @classmethod
+        def record(cls, value, info):
+            validated.append(info.field_name)
+            return value
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_WORKER_COUNT=5\nTST_QUEUE_NAME=jobs\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    settings = CountingSettings.load('pattern_agentic_settings')
+
+    # the first reload rebuilds the model and snapshots the .env values
+    env_file.write_text("TST_WORKER_COUNT=5\nTST_QUEUE_NAME=tasks\n")
+    settings.reload()
+    validated.clear()
+
+    env_file.write_text("TST_WORKER_COUNT=5\nTST_QUEUE_NAME=batches\n")
+    settings.reload()
+
+    assert validated == ['queue_name']
+    assert settings.queue_name == 'batches'
+    assert settings.worker_count == 5
+
+def test_settings_load_warns_when_dot_env_removed(monkeypatch, tmp_path, caplog):
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_WORKER_COUNT=5\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    monkeypatch.setenv('TST_WORKER_COUNT', '5')
+    logger = logging.getLogger('test_settings_load_warns')
+    Settings.load('pattern_agentic_settings', logger=logger)
+
+    env_file.unlink()
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        Settings.load('pattern_agentic_settings', logger=logger)
+
+    assert 'does not exist' in caplog.text
+
+
+def test_settings_reload_with_model_validator(monkeypatch, tmp_path):
+    class RangeSettings(PABaseSettings):
+        model_config = SettingsConfigDict(env_prefix="TST_")
+        lo: int
+        hi: int
+
+        @model_validator(mode='after')
+        def check_range(self):
+            if self.lo > self.hi:
+                raise ValueError("lo > hi")
+            return self
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_LO=1\nTST_HI=5\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    settings = RangeSettings.load('pattern_agentic_settings')
+
+    env_file.write_text("TST_LO=1\nTST_HI=50\n")
+    settings.reload()
+    # applying lo on its own would fail against the previous hi
+    env_file.write_text("TST_LO=70\nTST_HI=90\n")
+    settings.reload()
+
+    assert (settings.lo, settings.hi) == (70, 90)
+
+
+def test_settings_reload_merges_nested_values(monkeypatch, tmp_path):
+    class Database(BaseModel):
+        host: str = 'localhost'
+        port: int = 5432
+
+    class NestedSettings(PABaseSettings):
+        model_config = SettingsConfigDict(env_prefix="TST_", env_nested_delimiter='__')
+        db: Database = Database()
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_DB__PORT=5\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    monkeypatch.setenv('TST_DB__HOST', 'envhost')
+    settings = NestedSettings.load('pattern_agentic_settings')
+
+    env_file.write_text("TST_DB__PORT=66\n")
+    settings.reload()
+    env_file.write_text("TST_DB__PORT=777\n")
+    settings.reload()
+
+    assert settings.db == Database(host='envhost', port=777)
+
+
+def test_settings_reload_after_env_override_removed(monkeypatch, tmp_path):
+    class NumberSettings(PABaseSettings):
+        model_config = SettingsConfigDict(env_prefix="TST_")
+        n: int
+
+    env_file = tmp_path / ".env"
+    env_file.write_text("TST_N=1\n")
+    monkeypatch.setenv('TST_DOT_ENV', str(env_file))
+    settings = NumberSettings.load('pattern_agentic_settings')
+
+    env_file.write_text("TST_N=3\n")
+    settings.reload()
+    assert settings.n == 3
+
+    monkeypatch.setenv('TST_N', '99')
+    env_file.write_text("TST_N=4\n")
+    settings.reload()
+    assert settings.n == 99
+
+    monkeypatch.delenv('TST_N')
+    mtime = env_file.stat().st_mtime_ns + 1_000_000_000
+    os.utime(env_file, ns=(mtime, mtime))
+    settings.reload()
+    assert settings.n == 4
+